@@ -1,22 +1,23 @@
 from __future__ import annotations
 
 import os
+from typing import TYPE_CHECKING
 
-import anyio
 import typer
 
 from . import __version__
-from .bridge import BridgeConfig, _run_main_loop
-from .config import ConfigError, load_telegram_config
+from .config import ConfigError, load_telegram_config, validate_credentials
 from .engines import (
-    EngineBackend,
     get_backend,
     get_engine_config,
     list_backend_ids,
 )
 from .logging import setup_logging
-from .onboarding import check_setup, render_setup_guide
-from .telegram import TelegramClient
+
+if TYPE_CHECKING:
+    from .bridge import BridgeConfig
+    from .engines import EngineBackend
+    from .onboarding import SetupResult
 
 
 def _print_version_and_exit() -> None:
@@ -33,27 +34,20 @@ def _parse_bridge_config(
     *,
     final_notify: bool,
     backend: EngineBackend,
+    setup: SetupResult | None = None,
 ) -> BridgeConfig:
+    # Imported here (with the other bridge-only modules) so `takopi --version`
+    # and `--help` don't pay for httpx and the markdown stack.
+    from .bridge import BridgeConfig
+    from .telegram import TelegramClient
+
     startup_pwd = os.getcwd()
 
-    config, config_path = load_telegram_config()
-    try:
-        token = config["bot_token"]
-    except KeyError:
-        raise ConfigError(f"Missing key `bot_token` in {config_path}.") from None
-    if not isinstance(token, str) or not token.strip():
-        raise ConfigError(
-            f"Invalid `bot_token` in {config_path}; expected a non-empty string."
-        ) from None
-    try:
-        chat_id_value = config["chat_id"]
-    except KeyError:
-        raise ConfigError(f"Missing key `chat_id` in {config_path}.") from None
-    if isinstance(chat_id_value, bool) or not isinstance(chat_id_value, int):
-        raise ConfigError(
-            f"Invalid `chat_id` in {config_path}; expected an integer."
-        ) from None
-    chat_id = chat_id_value
+    if setup is not None:
+        config, config_path = setup.config, setup.config_path
+    else:
+        config, config_path = load_telegram_config()
+    token, chat_id = validate_credentials(config, config_path)
     start_prompt_value = config.get("start_prompt")
     if start_prompt_value is not None and not isinstance(start_prompt_value, str):
         raise ConfigError(
@@ -100,6 +94,11 @@ def run(
         help="Log engine JSONL, Telegram requests, and rendered messages.",
     ),
 ) -> None:
+    import anyio
+
+    from .bridge import _run_main_loop
+    from .onboarding import check_setup, render_setup_guide
+
     setup_logging(debug=debug)
     try:
         backend = get_backend(engine)
@@ -114,6 +113,7 @@ def run(
         cfg = _parse_bridge_config(
             final_notify=final_notify,
             backend=backend,
+            setup=setup,
         )
     except ConfigError as e:
         typer.echo(str(e), err=True)
@@ -13,6 +13,26 @@ class ConfigError(RuntimeError):
     pass
 
 
+def validate_credentials(config: dict, config_path: Path) -> tuple[str, int]:
+    try:
+        token = config["bot_token"]
+    except KeyError:
+        raise ConfigError(f"Missing key `bot_token` in {config_path}.") from None
+    if not isinstance(token, str) or not token.strip():
+        raise ConfigError(
+            f"Invalid `bot_token` in {config_path}; expected a non-empty string."
+        ) from None
+    try:
+        chat_id = config["chat_id"]
+    except KeyError:
+        raise ConfigError(f"Missing key `chat_id` in {config_path}.") from None
+    if isinstance(chat_id, bool) or not isinstance(chat_id, int):
+        raise ConfigError(
+            f"Invalid `chat_id` in {config_path}; expected an integer."
+        ) from None
+    return token, chat_id
+
+
 def _config_candidates() -> list[Path]:
     candidates = [Path.cwd() / LOCAL_CONFIG_NAME, HOME_CONFIG_PATH]
     if candidates[0] == candidates[1]:
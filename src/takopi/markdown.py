@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+from collections import OrderedDict
 from typing import Any, Callable
 
 from markdown_it import MarkdownIt
@@ -12,15 +13,38 @@ TELEGRAM_MARKDOWN_LIMIT = 3500
 
 _md = MarkdownIt("commonmark", {"html": False})
 
+_BULLET_RE = re.compile(r"(?m)^(\s*)•")
 
-def render_markdown(md: str) -> tuple[str, list[dict[str, Any]]]:
-    html = _md.render(md or "")
-    rendered = transform_html(html)
+# Anything that could change under a markdown parse: metacharacters, HTML
+# escapes, the bullets _BULLET_RE rewrites, whitespace that commonmark would
+# collapse, or list/heading markers at the start of the string (newlines are
+# excluded, so line start == string start).
+_NOT_PLAIN_RE = re.compile(r"[*_`~\[\]()<>#&\\\n\r\t•]|^\s|\s\s|\s$|^\d+[.)]|^[-+.]")
+
+_RENDER_CACHE: OrderedDict[str, tuple[str, list[dict[str, Any]]]] = OrderedDict()
+_RENDER_CACHE_MAX = 64
 
-    text = re.sub(r"(?m)^(\s*)•", r"\1-", rendered.text)
 
-    entities = [dict(e) for e in rendered.entities]
-    return text, entities
+def render_markdown(md: str) -> tuple[str, list[dict[str, Any]]]:
+    key = md or ""
+    if key and not _NOT_PLAIN_RE.search(key):
+        # Plain text renders as a single paragraph with no entities; skip the
+        # parser and match its output (trailing paragraph break included).
+        return key + "\n\n", []
+    cached = _RENDER_CACHE.get(key)
+    if cached is not None:
+        _RENDER_CACHE.move_to_end(key)
+    else:
+        html = _md.render(key)
+        rendered = transform_html(html)
+        text = _BULLET_RE.sub(r"\1-", rendered.text)
+        cached = (text, [dict(e) for e in rendered.entities])
+        _RENDER_CACHE[key] = cached
+        if len(_RENDER_CACHE) > _RENDER_CACHE_MAX:
+            _RENDER_CACHE.popitem(last=False)
+
+    text, entities = cached
+    return text, [dict(e) for e in entities]
 
 
 def truncate_for_telegram(
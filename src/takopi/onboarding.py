@@ -1,12 +1,17 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from rich.console import Console
 from rich.panel import Panel
 
-from .config import ConfigError, HOME_CONFIG_PATH, load_telegram_config
+from .config import (
+    ConfigError,
+    HOME_CONFIG_PATH,
+    load_telegram_config,
+    validate_credentials,
+)
 from .engines import EngineBackend, SetupIssue
 
 _OCTOPUS = "\N{OCTOPUS}"
@@ -16,6 +21,7 @@ _OCTOPUS = "\N{OCTOPUS}"
 class SetupResult:
     issues: list[SetupIssue]
     config_path: Path = HOME_CONFIG_PATH
+    config: dict = field(default_factory=dict)
 
     @property
     def ok(self) -> bool:
@@ -54,17 +60,17 @@ def check_setup(backend: EngineBackend) -> SetupResult:
         issues.append(_config_issue(config_path))
         return SetupResult(issues=issues, config_path=config_path)
 
-    token = config.get("bot_token")
-    chat_id = config.get("chat_id")
-
-    missing_or_invalid_config = not (isinstance(token, str) and token.strip())
-    missing_or_invalid_config |= type(chat_id) is not int
+    try:
+        validate_credentials(config, config_path)
+        missing_or_invalid_config = False
+    except ConfigError:
+        missing_or_invalid_config = True
 
     issues.extend(backend.check_setup(config, config_path))
     if missing_or_invalid_config:
         issues.append(_config_issue(config_path))
 
-    return SetupResult(issues=issues, config_path=config_path)
+    return SetupResult(issues=issues, config_path=config_path, config=config)
 
 
 def _config_path_display(path: Path) -> str:
@@ -80,22 +86,13 @@ def render_setup_guide(result: SetupResult) -> None:
         return
 
     console = Console(stderr=True)
-    parts: list[str] = []
-    step = 0
-
-    def add_step(title: str, *lines: str) -> None:
-        nonlocal step
-        step += 1
-        parts.append(f"[bold yellow]{step}.[/] [bold]{title}[/]")
-        parts.append("")
-        parts.extend(lines)
-        parts.append("")
-
-    for issue in result.issues:
-        add_step(issue.title, *issue.lines)
+    sections = [
+        f"[bold yellow]{step}.[/] [bold]{issue.title}[/]\n\n" + "\n".join(issue.lines)
+        for step, issue in enumerate(result.issues, start=1)
+    ]
 
     panel = Panel(
-        "\n".join(parts).rstrip(),
+        "\n\n".join(sections).rstrip(),
         title="[bold]Welcome to takopi![/]",
         subtitle=f"{_OCTOPUS} setup required",
         border_style="yellow",
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 import textwrap
 from collections import deque
 from pathlib import Path
@@ -60,9 +61,16 @@ def format_header(elapsed_s: float, item: int | None, label: str) -> str:
     return HEADER_SEP.join(parts)
 
 
+# Matches any whitespace textwrap.shorten would collapse: non-space whitespace
+# (including NBSP, \v, \f), runs of spaces, or leading/trailing spaces.
+_SHORTEN_COLLAPSIBLE_RE = re.compile(r"[^\S ]|  |^ | $")
+
+
 def shorten(text: str, width: int | None) -> str:
     if width is None:
         return text
+    if len(text) <= width and not _SHORTEN_COLLAPSIBLE_RE.search(text):
+        return text
     return textwrap.shorten(text, width=width, placeholder="…")
 
 
@@ -181,6 +189,7 @@ class ExecProgressRenderer:
         self.session_title: str | None = None
         self._resume_formatter = resume_formatter
         self.show_title = show_title
+        self._body_cache: str | None = None
 
     def note_event(self, event: TakopiEvent) -> bool:
         match event:
@@ -229,6 +238,7 @@ class ExecProgressRenderer:
         line = f"{status} {title}{suffix}"
 
         self._append_action(action_id, completed=completed, line=line)
+        self._body_cache = None
         return True
 
     def _append_action(self, action_id: str, *, completed: bool, line: str) -> None:
@@ -254,7 +264,9 @@ class ExecProgressRenderer:
     def render_progress(self, elapsed_s: float, label: str = "working") -> str:
         step = self.action_count or None
         header = format_header(elapsed_s, step, label=self._label_with_title(label))
-        message = self._assemble(header, list(self.recent_actions))
+        if self._body_cache is None:
+            self._body_cache = HARD_BREAK.join(self.recent_actions)
+        message = header if not self._body_cache else header + "\n\n" + self._body_cache
         return self._append_resume(message)
 
     def render_final(self, elapsed_s: float, answer: str, status: str = "done") -> str:
@@ -273,7 +285,3 @@ class ExecProgressRenderer:
         if not self.resume_token or self._resume_formatter is None:
             return message
         return message + "\n\n" + self._resume_formatter(self.resume_token)
-
-    @staticmethod
-    def _assemble(header: str, lines: list[str]) -> str:
-        return header if not lines else header + "\n\n" + HARD_BREAK.join(lines)
@@ -1,20 +1,17 @@
 from __future__ import annotations
 
-import json
 import logging
 import os
 import signal
 import subprocess
-from collections import deque
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Any, cast
+from typing import Any
 from weakref import WeakValueDictionary
 
 import anyio
 from anyio.abc import ByteReceiveStream, Process
-from anyio.streams.text import TextReceiveStream
 from ..model import (
     Action,
     ActionEvent,
@@ -29,10 +26,16 @@ from ..model import (
 )
 from ..runner import ResumeRunnerMixin, Runner, compile_resume_pattern
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 logger = logging.getLogger(__name__)
 
 ENGINE: EngineId = EngineId("codex")
-STDERR_TAIL_LINES = 200
+STDERR_TAIL_BYTES = 64 * 1024
+_RECEIVE_MAX_BYTES = 64 * 1024
 
 _ACTION_KIND_MAP: dict[str, ActionKind] = {
     "command_execution": "command",
@@ -43,9 +46,16 @@ _ACTION_KIND_MAP: dict[str, ActionKind] = {
     "reasoning": "note",
     "todo_list": "note",
 }
+_KIND_GET = _ACTION_KIND_MAP.get
 
 _RESUME_RE = compile_resume_pattern(ENGINE)
 
+_ETYPE_TO_PHASE: dict[str, ActionPhase] = {
+    "item.started": "started",
+    "item.updated": "updated",
+    "item.completed": "completed",
+}
+
 
 def _started_event(token: ResumeToken, *, title: str) -> StartedEvent:
     return StartedEvent(engine=token.engine, resume=token, title=title)
@@ -69,6 +79,10 @@ def _completed_event(
     )
 
 
+# Shared by every detail-less action; renderers only ever read the detail dict.
+_EMPTY_DETAIL: dict[str, Any] = {}
+
+
 def _action_event(
     *,
     phase: ActionPhase,
@@ -84,7 +98,7 @@ def _action_event(
         id=action_id,
         kind=kind,
         title=title,
-        detail=detail or {},
+        detail=detail if detail is not None else _EMPTY_DETAIL,
     )
     return ActionEvent(
         engine=ENGINE,
@@ -115,6 +129,13 @@ def _note_completed(
     )
 
 
+def _as_title(value: Any) -> str:
+    # Codex sends titles as strings already; skip the str() round-trip then.
+    if type(value) is str:
+        return value
+    return str(value) if value else ""
+
+
 def _short_tool_name(item: dict[str, Any]) -> str:
     name = ".".join(part for part in (item.get("server"), item.get("tool")) if part)
     return name or "tool"
@@ -190,23 +211,216 @@ def _todo_title(summary: _TodoSummary) -> str:
     return f"todo {summary.done}/{summary.total}: done"
 
 
-def _translate_item_event(etype: str, item: dict[str, Any]) -> list[TakopiEvent]:
-    item_type = item.get("type") or item.get("item_type")
-    if item_type == "assistant_message":
-        item_type = "agent_message"
-
-    if not item_type:
-        return []
+def _command_running(
+    item: dict[str, Any], action_id: str, phase: ActionPhase, item_type: str
+) -> list[TakopiEvent]:
+    return [
+        _action_event(
+            phase=phase,
+            action_id=action_id,
+            kind="command",
+            title=_as_title(item.get("command")),
+        )
+    ]
+
+
+def _command_completed(
+    item: dict[str, Any], action_id: str, phase: ActionPhase, item_type: str
+) -> list[TakopiEvent]:
+    exit_code = item.get("exit_code")
+    ok = item.get("status") != "failed"
+    if isinstance(exit_code, int):
+        ok = ok and exit_code == 0
+    return [
+        _action_event(
+            phase="completed",
+            action_id=action_id,
+            kind="command",
+            title=_as_title(item.get("command")),
+            detail={
+                "exit_code": exit_code,
+                "status": item.get("status"),
+            },
+            ok=ok,
+        )
+    ]
+
+
+def _tool_title_detail(
+    item: dict[str, Any], item_type: str
+) -> tuple[str, dict[str, Any]]:
+    if item_type == "tool_call":
+        name = item.get("name")
+        title = str(name) if name else "tool"
+        detail = {"name": name, "status": item.get("status")}
+    else:
+        title = _short_tool_name(item)
+        detail = {
+            "server": item.get("server"),
+            "tool": item.get("tool"),
+            "status": item.get("status"),
+        }
+    if "arguments" in item:
+        detail["arguments"] = item.get("arguments")
+    return title, detail
+
+
+def _tool_running(
+    item: dict[str, Any], action_id: str, phase: ActionPhase, item_type: str
+) -> list[TakopiEvent]:
+    title, detail = _tool_title_detail(item, item_type)
+    return [
+        _action_event(
+            phase=phase,
+            action_id=action_id,
+            kind="tool",
+            title=title,
+            detail=detail,
+        )
+    ]
+
+
+def _tool_completed(
+    item: dict[str, Any], action_id: str, phase: ActionPhase, item_type: str
+) -> list[TakopiEvent]:
+    title, detail = _tool_title_detail(item, item_type)
+    ok = item.get("status") != "failed" and not item.get("error")
+    error = item.get("error")
+    if error:
+        detail["error_message"] = str(
+            error.get("message") if isinstance(error, dict) else error
+        )
+    result_summary = _summarize_tool_result(item.get("result"))
+    if result_summary is not None:
+        detail["result_summary"] = result_summary
+    return [
+        _action_event(
+            phase="completed",
+            action_id=action_id,
+            kind="tool",
+            title=title,
+            detail=detail,
+            ok=ok,
+        )
+    ]
+
+
+def _web_search_running(
+    item: dict[str, Any], action_id: str, phase: ActionPhase, item_type: str
+) -> list[TakopiEvent]:
+    return [
+        _action_event(
+            phase=phase,
+            action_id=action_id,
+            kind="web_search",
+            title=_as_title(item.get("query")),
+            detail={"query": item.get("query")},
+        )
+    ]
+
+
+def _web_search_completed(
+    item: dict[str, Any], action_id: str, phase: ActionPhase, item_type: str
+) -> list[TakopiEvent]:
+    return [
+        _action_event(
+            phase="completed",
+            action_id=action_id,
+            kind="web_search",
+            title=_as_title(item.get("query")),
+            detail={"query": item.get("query")},
+            ok=True,
+        )
+    ]
+
+
+def _file_change_completed(
+    item: dict[str, Any], action_id: str, phase: ActionPhase, item_type: str
+) -> list[TakopiEvent]:
+    return [
+        _action_event(
+            phase="completed",
+            action_id=action_id,
+            kind="file_change",
+            title=_format_change_summary(item),
+            detail={
+                "changes": item.get("changes") or [],
+                "status": item.get("status"),
+                "error": item.get("error"),
+            },
+            ok=item.get("status") != "failed",
+        )
+    ]
+
+
+def _note_title_detail(
+    item: dict[str, Any], item_type: str
+) -> tuple[str, dict[str, Any] | None]:
+    if item_type == "todo_list":
+        summary = _summarize_todo_list(item.get("items"))
+        return _todo_title(summary), {"done": summary.done, "total": summary.total}
+    return _as_title(item.get("text")), None
+
+
+def _note_running(
+    item: dict[str, Any], action_id: str, phase: ActionPhase, item_type: str
+) -> list[TakopiEvent]:
+    title, detail = _note_title_detail(item, item_type)
+    return [
+        _action_event(
+            phase=phase,
+            action_id=action_id,
+            kind="note",
+            title=title,
+            detail=detail,
+        )
+    ]
+
+
+def _note_item_completed(
+    item: dict[str, Any], action_id: str, phase: ActionPhase, item_type: str
+) -> list[TakopiEvent]:
+    title, detail = _note_title_detail(item, item_type)
+    return [
+        _action_event(
+            phase="completed",
+            action_id=action_id,
+            kind="note",
+            title=title,
+            detail=detail,
+            ok=True,
+        )
+    ]
+
+
+_ItemHandler = Callable[[dict[str, Any], str, ActionPhase, str], list[TakopiEvent]]
+
+_ITEM_DISPATCH: dict[tuple[ActionKind, ActionPhase], _ItemHandler] = {
+    ("command", "started"): _command_running,
+    ("command", "updated"): _command_running,
+    ("command", "completed"): _command_completed,
+    ("tool", "started"): _tool_running,
+    ("tool", "updated"): _tool_running,
+    ("tool", "completed"): _tool_completed,
+    ("web_search", "started"): _web_search_running,
+    ("web_search", "updated"): _web_search_running,
+    ("web_search", "completed"): _web_search_completed,
+    ("file_change", "completed"): _file_change_completed,
+    ("note", "started"): _note_running,
+    ("note", "updated"): _note_running,
+    ("note", "completed"): _note_item_completed,
+}
 
-    if item_type == "agent_message":
-        return []
 
+def _translate_item_event(
+    etype: str, item: dict[str, Any], item_type: str
+) -> list[TakopiEvent]:
     action_id = item.get("id")
     if not isinstance(action_id, str) or not action_id:
         logger.debug("[codex] missing item id in codex event: %r", item)
         return []
 
-    phase = cast(ActionPhase, etype.split(".")[-1])
+    phase = _ETYPE_TO_PHASE[etype]
 
     if item_type == "error":
         if phase != "completed":
@@ -225,212 +439,96 @@ def _translate_item_event(etype: str, item: dict[str, Any]) -> list[TakopiEvent]
             )
         ]
 
-    kind = _ACTION_KIND_MAP.get(item_type)
+    kind = _KIND_GET(item_type)
     if kind is None:
         return []
 
-    if kind == "command":
-        title = str(item.get("command") or "")
-        if phase in {"started", "updated"}:
-            return [
-                _action_event(
-                    phase=phase,
-                    action_id=action_id,
-                    kind=kind,
-                    title=title,
-                )
-            ]
-        if phase == "completed":
-            exit_code = item.get("exit_code")
-            ok = item.get("status") != "failed"
-            if isinstance(exit_code, int):
-                ok = ok and exit_code == 0
-            detail = {
-                "exit_code": exit_code,
-                "status": item.get("status"),
-            }
-            return [
-                _action_event(
-                    phase="completed",
-                    action_id=action_id,
-                    kind=kind,
-                    title=title,
-                    detail=detail,
-                    ok=ok,
-                )
-            ]
-
-    if kind == "tool":
-        tool_name = _short_tool_name(item)
-        title = tool_name
-        detail = {
-            "server": item.get("server"),
-            "tool": item.get("tool"),
-            "status": item.get("status"),
-        }
-        if "arguments" in item:
-            detail["arguments"] = item.get("arguments")
-        if item_type == "tool_call":
-            name = item.get("name")
-            tool_name = str(name) if name else "tool"
-            title = tool_name
-            detail = {"name": name, "status": item.get("status")}
-            if "arguments" in item:
-                detail["arguments"] = item.get("arguments")
-
-        if phase in {"started", "updated"}:
-            return [
-                _action_event(
-                    phase=phase,
-                    action_id=action_id,
-                    kind=kind,
-                    title=title,
-                    detail=detail,
-                )
-            ]
-        if phase == "completed":
-            ok = item.get("status") != "failed" and not item.get("error")
-            error = item.get("error")
-            if error:
-                detail["error_message"] = str(
-                    error.get("message") if isinstance(error, dict) else error
-                )
-            result_summary = _summarize_tool_result(item.get("result"))
-            if result_summary is not None:
-                detail["result_summary"] = result_summary
-            return [
-                _action_event(
-                    phase="completed",
-                    action_id=action_id,
-                    kind=kind,
-                    title=title,
-                    detail=detail,
-                    ok=ok,
-                )
-            ]
-
-    if kind == "web_search":
-        title = str(item.get("query") or "")
-        detail = {"query": item.get("query")}
-        if phase in {"started", "updated"}:
-            return [
-                _action_event(
-                    phase=phase,
-                    action_id=action_id,
-                    kind=kind,
-                    title=title,
-                    detail=detail,
-                )
-            ]
-        if phase == "completed":
-            return [
-                _action_event(
-                    phase="completed",
-                    action_id=action_id,
-                    kind=kind,
-                    title=title,
-                    detail=detail,
-                    ok=True,
-                )
-            ]
-
-    if kind == "file_change":
-        if phase != "completed":
-            return []
-        title = _format_change_summary(item)
-        detail = {
-            "changes": item.get("changes") or [],
-            "status": item.get("status"),
-            "error": item.get("error"),
-        }
-        ok = item.get("status") != "failed"
-        return [
-            _action_event(
-                phase="completed",
-                action_id=action_id,
-                kind=kind,
-                title=title,
-                detail=detail,
-                ok=ok,
-            )
-        ]
-
-    if kind == "note":
-        if item_type == "todo_list":
-            summary = _summarize_todo_list(item.get("items"))
-            title = _todo_title(summary)
-            detail = {"done": summary.done, "total": summary.total}
-        else:
-            title = str(item.get("text") or "")
-            detail = None
-
-        if phase in {"started", "updated"}:
-            return [
-                _action_event(
-                    phase=phase,
-                    action_id=action_id,
-                    kind=kind,
-                    title=title,
-                    detail=detail,
-                )
-            ]
-        if phase == "completed":
-            return [
-                _action_event(
-                    phase="completed",
-                    action_id=action_id,
-                    kind=kind,
-                    title=title,
-                    detail=detail,
-                    ok=True,
-                )
-            ]
+    handler = _ITEM_DISPATCH.get((kind, phase))
+    if handler is None:
+        return []
+    return handler(item, action_id, phase, item_type)
 
-    return []
 
+def _translate_event(
+    event: dict[str, Any], etype: str | None, *, title: str
+) -> tuple[list[TakopiEvent], str | None]:
+    """Translate one codex event, also surfacing any completed agent message.
 
-def translate_codex_event(event: dict[str, Any], *, title: str) -> list[TakopiEvent]:
-    etype = event.get("type")
+    Returns the events to emit plus the agent message text when the event is a
+    completed ``agent_message`` item, so the caller can track the final answer
+    without normalizing the item a second time.
+    """
+    if etype is None:
+        etype = event.get("type")
     if etype == "thread.started":
         thread_id = event.get("thread_id")
         if thread_id:
             token = ResumeToken(engine=ENGINE, value=str(thread_id))
-            return [_started_event(token, title=title)]
+            return [_started_event(token, title=title)], None
         logger.debug("[codex] codex thread.started missing thread_id: %r", event)
-        return []
+        return [], None
 
-    if etype in {"item.started", "item.updated", "item.completed"}:
+    if etype in _ETYPE_TO_PHASE:
         item = event.get("item") or {}
-        return _translate_item_event(etype, item)
-
-    return []
-
-
-async def _iter_text_lines(stream: ByteReceiveStream):
-    text_stream = TextReceiveStream(stream, errors="replace")
-    buffer = ""
+        item_type = item.get("type") or item.get("item_type")
+        if item_type == "assistant_message":
+            item_type = "agent_message"
+        if not item_type:
+            return [], None
+        if item_type == "agent_message":
+            if etype == "item.completed":
+                text = item.get("text")
+                if isinstance(text, str):
+                    return [], text
+            return [], None
+        return _translate_item_event(etype, item, item_type), None
+
+    return [], None
+
+
+def translate_codex_event(
+    event: dict[str, Any], *, title: str, etype: str | None = None
+) -> list[TakopiEvent]:
+    events, _ = _translate_event(event, etype, title=title)
+    return events
+
+
+async def _iter_byte_lines(stream: ByteReceiveStream):
+    """Yield whitespace-stripped lines, skipping blank ones."""
+    buffer = bytearray()
     while True:
         try:
-            chunk = await text_stream.receive()
+            chunk = await stream.receive(_RECEIVE_MAX_BYTES)
         except anyio.EndOfStream:
-            if buffer:
-                yield buffer
+            line = bytes(buffer).strip()
+            if line:
+                yield line
             return
-        buffer += chunk
+        buffer.extend(chunk)
         while True:
-            split_at = buffer.find("\n")
+            split_at = buffer.find(b"\n")
             if split_at < 0:
                 break
-            line = buffer[: split_at + 1]
-            buffer = buffer[split_at + 1 :]
-            yield line
+            line = bytes(buffer[:split_at]).strip()
+            del buffer[: split_at + 1]
+            if line:
+                yield line
 
 
-async def _drain_stderr(stderr: ByteReceiveStream, chunks: deque[str]) -> None:
+async def _drain_stderr(stderr: ByteReceiveStream, tail: bytearray) -> None:
+    debug_on = logger.isEnabledFor(logging.DEBUG)
+    debug = logger.debug
     try:
-        async for line in _iter_text_lines(stderr):
-            logger.debug("[codex][stderr] %s", line.rstrip())
-            chunks.append(line)
+        while True:
+            try:
+                chunk = await stderr.receive(_RECEIVE_MAX_BYTES)
+            except anyio.EndOfStream:
+                return
+            if debug_on:
+                debug("[codex][stderr] %s", chunk.decode("utf-8", "replace").rstrip())
+            tail.extend(chunk)
+            if len(tail) > STDERR_TAIL_BYTES:
+                del tail[: len(tail) - STDERR_TAIL_BYTES]
     except Exception as e:
         logger.debug("[codex][stderr] drain error: %s", e)
 
@@ -507,12 +605,12 @@ class CodexRunner(ResumeRunnerMixin, Runner):
         self.codex_cmd = codex_cmd
         self.extra_args = extra_args
         self.session_title = title
-        self._session_locks: WeakValueDictionary[str, anyio.Lock] = (
+        self._session_locks: WeakValueDictionary[tuple[EngineId, str], anyio.Lock] = (
             WeakValueDictionary()
         )
 
     def _lock_for(self, token: ResumeToken) -> anyio.Lock:
-        key = f"{token.engine}:{token.value}"
+        key = (token.engine, token.value)
         lock = self._session_locks.get(key)
         if lock is None:
             lock = anyio.Lock()
@@ -569,7 +667,7 @@ class CodexRunner(ResumeRunnerMixin, Runner):
                 proc_stderr = proc.stderr
                 logger.debug("[codex] spawn pid=%s args=%r", proc.pid, args)
 
-                stderr_chunks: deque[str] = deque(maxlen=STDERR_TAIL_LINES)
+                stderr_tail = bytearray()
                 rc: int | None = None
 
                 expected_session: ResumeToken | None = resume_token
@@ -584,118 +682,133 @@ class CodexRunner(ResumeRunnerMixin, Runner):
                     note_seq += 1
                     return f"codex.note.{note_seq}"
 
+                def _on_error(evt: dict[str, Any]) -> list[TakopiEvent]:
+                    nonlocal did_emit_completed
+                    message = str(evt.get("message") or "codex error")
+                    fatal_flag = evt.get("fatal")
+                    if fatal_flag is True or fatal_flag is None:
+                        did_emit_completed = True
+                        return [
+                            _completed_event(
+                                resume=found_session or resume_token,
+                                ok=False,
+                                answer=final_answer or "",
+                                error=message,
+                            )
+                        ]
+                    return [
+                        _note_completed(
+                            next_note_id(),
+                            message,
+                            ok=False,
+                            detail={
+                                "code": evt.get("code"),
+                                "fatal": evt.get("fatal"),
+                            },
+                        )
+                    ]
+
+                def _on_turn_failed(evt: dict[str, Any]) -> list[TakopiEvent]:
+                    nonlocal did_emit_completed
+                    error = evt.get("error") or {}
+                    message = str(error.get("message") or "codex turn failed")
+                    did_emit_completed = True
+                    return [
+                        _completed_event(
+                            resume=found_session or resume_token,
+                            ok=False,
+                            answer=final_answer or "",
+                            error=message,
+                        )
+                    ]
+
+                def _on_turn_rate_limited(evt: dict[str, Any]) -> list[TakopiEvent]:
+                    retry_ms = evt.get("retry_after_ms")
+                    message = "rate limited"
+                    if isinstance(retry_ms, int):
+                        message = f"rate limited (retry after {retry_ms}ms)"
+                    return [_note_completed(next_note_id(), message, ok=False)]
+
+                def _on_turn_started(evt: dict[str, Any]) -> list[TakopiEvent]:
+                    nonlocal turn_index
+                    action_id = f"turn_{turn_index}"
+                    turn_index += 1
+                    return [
+                        _action_event(
+                            phase="started",
+                            action_id=action_id,
+                            kind="turn",
+                            title="turn started",
+                        )
+                    ]
+
+                def _on_turn_completed(evt: dict[str, Any]) -> list[TakopiEvent]:
+                    nonlocal did_emit_completed
+                    did_emit_completed = True
+                    return [
+                        _completed_event(
+                            resume=found_session or resume_token,
+                            ok=True,
+                            answer=final_answer or "",
+                            usage=evt.get("usage"),
+                        )
+                    ]
+
+                # One dict lookup per event instead of a chain of string
+                # comparisons; the closures capture the run's mutable state.
+                dispatch = {
+                    "error": _on_error,
+                    "turn.failed": _on_turn_failed,
+                    "turn.rate_limited": _on_turn_rate_limited,
+                    "turn.started": _on_turn_started,
+                    "turn.completed": _on_turn_completed,
+                }
+
+                debug_on = logger.isEnabledFor(logging.DEBUG)
+                debug = logger.debug
                 async with anyio.create_task_group() as tg:
-                    tg.start_soon(_drain_stderr, proc_stderr, stderr_chunks)
+                    tg.start_soon(_drain_stderr, proc_stderr, stderr_tail)
                     await proc_stdin.send(prompt.encode())
                     await proc_stdin.aclose()
 
-                    async for raw_line in _iter_text_lines(proc_stdout):
-                        raw = raw_line.rstrip("\n")
-                        logger.debug("[codex][jsonl] %s", raw)
-                        line = raw.strip()
-                        if not line:
-                            continue
+                    async for line in _iter_byte_lines(proc_stdout):
+                        if debug_on:
+                            debug("[codex][jsonl] %s", line.decode("utf-8", "replace"))
                         if did_emit_completed:
                             continue
                         try:
-                            evt = json.loads(line)
-                        except json.JSONDecodeError:
-                            logger.debug("[codex] invalid json line: %s", line)
+                            evt = _json_loads(line)
+                        except ValueError:
+                            decoded = line.decode("utf-8", "replace")
+                            if debug_on:
+                                debug("[codex] invalid json line: %s", decoded)
                             note = _note_completed(
                                 next_note_id(),
                                 "invalid JSON from codex; ignoring line",
                                 ok=False,
-                                detail={"line": line},
+                                detail={"line": decoded},
                             )
                             yield note
                             continue
 
                         etype = evt.get("type")
-                        if etype == "error":
-                            message = str(evt.get("message") or "codex error")
-                            fatal_flag = evt.get("fatal")
-                            fatal = fatal_flag is True or fatal_flag is None
-                            if fatal:
-                                resume_for_completed = found_session or resume_token
-                                yield _completed_event(
-                                    resume=resume_for_completed,
-                                    ok=False,
-                                    answer=final_answer or "",
-                                    error=message,
-                                )
-                                did_emit_completed = True
-                                continue
-                            note = _note_completed(
-                                next_note_id(),
-                                message,
-                                ok=False,
-                                detail={
-                                    "code": evt.get("code"),
-                                    "fatal": evt.get("fatal"),
-                                },
-                            )
-                            yield note
-                            continue
-                        if etype == "turn.failed":
-                            error = evt.get("error") or {}
-                            message = str(error.get("message") or "codex turn failed")
-                            resume_for_completed = found_session or resume_token
-                            yield _completed_event(
-                                resume=resume_for_completed,
-                                ok=False,
-                                answer=final_answer or "",
-                                error=message,
-                            )
-                            did_emit_completed = True
-                            continue
-                        if etype == "turn.rate_limited":
-                            retry_ms = evt.get("retry_after_ms")
-                            message = "rate limited"
-                            if isinstance(retry_ms, int):
-                                message = f"rate limited (retry after {retry_ms}ms)"
-                            note = _note_completed(next_note_id(), message, ok=False)
-                            yield note
-                            continue
-                        if etype == "turn.started":
-                            action_id = f"turn_{turn_index}"
-                            turn_index += 1
-                            yield _action_event(
-                                phase="started",
-                                action_id=action_id,
-                                kind="turn",
-                                title="turn started",
-                            )
-                            continue
-                        if etype == "turn.completed":
-                            resume_for_completed = found_session or resume_token
-                            yield _completed_event(
-                                resume=resume_for_completed,
-                                ok=True,
-                                answer=final_answer or "",
-                                usage=evt.get("usage"),
-                            )
-                            did_emit_completed = True
+                        handler = dispatch.get(etype)
+                        if handler is not None:
+                            for out_evt in handler(evt):
+                                yield out_evt
                             continue
 
-                        if evt.get("type") == "item.completed":
-                            item = evt.get("item") or {}
-                            item_type = item.get("type") or item.get("item_type")
-                            if item_type == "assistant_message":
-                                item_type = "agent_message"
-                            if item_type == "agent_message" and isinstance(
-                                item.get("text"), str
-                            ):
-                                if final_answer is None:
-                                    final_answer = item["text"]
-                                else:
-                                    logger.debug(
-                                        "[codex] emitted multiple agent messages; using the last one"
-                                    )
-                                    final_answer = item["text"]
-
-                        for out_evt in translate_codex_event(
-                            evt, title=self.session_title
-                        ):
+                        out_events, agent_text = _translate_event(
+                            evt, etype, title=self.session_title
+                        )
+                        if agent_text is not None:
+                            if final_answer is not None and debug_on:
+                                debug(
+                                    "[codex] emitted multiple agent messages; using the last one"
+                                )
+                            final_answer = agent_text
+
+                        for out_evt in out_events:
                             if isinstance(out_evt, StartedEvent):
                                 session = out_evt.resume
                                 if found_session is None:
@@ -723,7 +836,7 @@ class CodexRunner(ResumeRunnerMixin, Runner):
                 if did_emit_completed:
                     return
                 if rc != 0:
-                    stderr_text = "".join(stderr_chunks)
+                    stderr_text = stderr_tail.decode("utf-8", "replace")
                     message = f"codex exec failed (rc={rc})."
                     yield _note_completed(
                         next_note_id(),
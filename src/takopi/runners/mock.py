@@ -76,13 +76,13 @@ class MockRunner(ResumeRunnerMixin, Runner):
         self._answer = answer
         self._resume_value = resume_value
         self.title = title or str(engine).title()
-        self._session_locks: WeakValueDictionary[str, anyio.Lock] = (
+        self._session_locks: WeakValueDictionary[tuple[EngineId, str], anyio.Lock] = (
             WeakValueDictionary()
         )
         self.resume_re = compile_resume_pattern(engine)
 
     def _lock_for(self, token: ResumeToken) -> anyio.Lock:
-        key = f"{token.engine}:{token.value}"
+        key = (token.engine, token.value)
         lock = self._session_locks.get(key)
         if lock is None:
             lock = anyio.Lock()
@@ -1,16 +1,79 @@
 from __future__ import annotations
 
+import importlib.util
 import logging
+import socket
+import ssl
 from typing import Any, Protocol
 
 import httpx
 
 from .logging import RedactTokenFilter
 
+try:
+    from orjson import dumps as _dumps, loads as _loads
+except ImportError:
+    import json
+
+    from json import loads as _loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode(
+            "utf-8"
+        )
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+_API_METHODS = ("getUpdates", "sendMessage", "editMessageText", "deleteMessage")
+
+
+def _compact(params: dict[str, Any]) -> dict[str, Any]:
+    return {key: value for key, value in params.items() if value is not None}
+
+
+# Multiplex concurrent calls over one connection when httpx[http2] is installed.
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
 logger = logging.getLogger(__name__)
 logger.addFilter(RedactTokenFilter())
 
 
+def _keepalive_socket_options() -> list[tuple[int, int, int]]:
+    options = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30))
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10))
+    if hasattr(socket, "TCP_KEEPCNT"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3))
+    return options
+
+
+_ssl_context: ssl.SSLContext | None = None
+
+
+def _shared_ssl_context() -> ssl.SSLContext:
+    # One context for all transports so TLS session tickets survive reconnects.
+    # Built through httpx so the certifi/trust_env defaults stay in place.
+    global _ssl_context
+    if _ssl_context is None:
+        _ssl_context = httpx.create_ssl_context()
+    return _ssl_context
+
+
+def _build_client(timeout_s: float, limits: httpx.Limits) -> httpx.AsyncClient:
+    transport = httpx.AsyncHTTPTransport(
+        http2=_HTTP2,
+        limits=limits,
+        verify=_shared_ssl_context(),
+        socket_options=_keepalive_socket_options(),
+    )
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(timeout_s, connect=5), transport=transport
+    )
+
+
 class BotClient(Protocol):
     async def close(self) -> None: ...
 
@@ -53,26 +116,53 @@ class TelegramClient:
         if not token:
             raise ValueError("Telegram token is empty")
         self._base = f"https://api.telegram.org/bot{token}"
-        self._client = client or httpx.AsyncClient(timeout=timeout_s)
+        self._urls = {method: f"{self._base}/{method}" for method in _API_METHODS}
         self._owns_client = client is None
+        if client is not None:
+            self._client = client
+            self._poll_client = client
+        else:
+            self._client = _build_client(
+                timeout_s,
+                httpx.Limits(max_connections=16, max_keepalive_connections=8),
+            )
+            self._poll_client = _build_client(
+                timeout_s,
+                httpx.Limits(max_connections=2, max_keepalive_connections=1),
+            )
 
     async def close(self) -> None:
         if self._owns_client:
             await self._client.aclose()
+            await self._poll_client.aclose()
 
     async def _post(self, method: str, json_data: dict[str, Any]) -> Any | None:
         logger.debug("[telegram] request %s: %s", method, json_data)
+        client = self._poll_client if method == "getUpdates" else self._client
+        url = self._urls.get(method) or f"{self._base}/{method}"
+        content = _dumps(json_data)
         try:
-            resp = await self._client.post(f"{self._base}/{method}", json=json_data)
+            try:
+                resp = await client.post(url, content=content, headers=_JSON_HEADERS)
+            except (httpx.ConnectError, httpx.RemoteProtocolError) as e:
+                # A keep-alive socket dropped while idle; retry once on a fresh
+                # one. For RemoteProtocolError the first request may already
+                # have been processed (the error only proves the response was
+                # lost), so this trades a possible duplicate sendMessage for
+                # not dropping messages on stale connections.
+                logger.debug(
+                    "[telegram] retrying %s after connection error: %s", method, e
+                )
+                resp = await client.post(url, content=content, headers=_JSON_HEADERS)
         except httpx.HTTPError as e:
-            url = getattr(e.request, "url", None)
+            err_url = getattr(e.request, "url", None)
             logger.error(
-                "[telegram] network error method=%s url=%s: %s", method, url, e
+                "[telegram] network error method=%s url=%s: %s", method, err_url, e
             )
             return None
 
         try:
-            payload = resp.json()
+            payload = _loads(resp.content)
         except Exception as e:
             logger.error(
                 "[telegram] bad response method=%s status=%s url=%s: %s",
@@ -110,11 +200,13 @@ class TelegramClient:
         timeout_s: int = 50,
         allowed_updates: list[str] | None = None,
     ) -> list[dict] | None:
-        params: dict[str, Any] = {"timeout": timeout_s}
-        if offset is not None:
-            params["offset"] = offset
-        if allowed_updates is not None:
-            params["allowed_updates"] = allowed_updates
+        params = _compact(
+            {
+                "timeout": timeout_s,
+                "offset": offset,
+                "allowed_updates": allowed_updates,
+            }
+        )
         return await self._post("getUpdates", params)  # type: ignore[return-value]
 
     async def send_message(
@@ -126,18 +218,16 @@ class TelegramClient:
         entities: list[dict] | None = None,
         parse_mode: str | None = None,
     ) -> dict | None:
-        params: dict[str, Any] = {
-            "chat_id": chat_id,
-            "text": text,
-        }
-        if disable_notification is not None:
-            params["disable_notification"] = disable_notification
-        if reply_to_message_id is not None:
-            params["reply_to_message_id"] = reply_to_message_id
-        if entities is not None:
-            params["entities"] = entities
-        if parse_mode is not None:
-            params["parse_mode"] = parse_mode
+        params = _compact(
+            {
+                "chat_id": chat_id,
+                "text": text,
+                "disable_notification": disable_notification,
+                "reply_to_message_id": reply_to_message_id,
+                "entities": entities,
+                "parse_mode": parse_mode,
+            }
+        )
         return await self._post("sendMessage", params)  # type: ignore[return-value]
 
     async def edit_message_text(
@@ -148,15 +238,15 @@ class TelegramClient:
         entities: list[dict] | None = None,
         parse_mode: str | None = None,
     ) -> dict | None:
-        params: dict[str, Any] = {
-            "chat_id": chat_id,
-            "message_id": message_id,
-            "text": text,
-        }
-        if entities is not None:
-            params["entities"] = entities
-        if parse_mode is not None:
-            params["parse_mode"] = parse_mode
+        params = _compact(
+            {
+                "chat_id": chat_id,
+                "message_id": message_id,
+                "text": text,
+                "entities": entities,
+                "parse_mode": parse_mode,
+            }
+        )
         return await self._post("editMessageText", params)  # type: ignore[return-value]
 
     async def delete_message(self, chat_id: int, message_id: int) -> bool:
@@ -1,4 +1,6 @@
-from takopi.markdown import render_markdown
+from sulguk import transform_html
+
+from takopi.markdown import _BULLET_RE, _md, render_markdown
 
 
 def test_render_markdown_basic_entities() -> None:
@@ -11,6 +13,37 @@ def test_render_markdown_basic_entities() -> None:
     ]
 
 
+def _parser_render(md: str) -> tuple[str, list[dict]]:
+    rendered = transform_html(_md.render(md))
+    text = _BULLET_RE.sub(r"\1-", rendered.text)
+    return text, [dict(e) for e in rendered.entities]
+
+
+def test_render_markdown_plain_fast_path_matches_parser() -> None:
+    corpus = [
+        "done",
+        "thinking…",
+        "hello world",
+        "exit code 0",
+        "100% done",
+        "v2.0 released",
+        "it's fine, really!",
+        "emoji 🐙 ok",
+        "über café",
+        "a - b",
+        "q? yes: sure",
+        "•foo",
+        "• bullet item",
+        "1. item",
+        "- item",
+        "a  b",
+        " lead",
+        "trail ",
+    ]
+    for md in corpus:
+        assert render_markdown(md) == _parser_render(md), md
+
+
 def test_render_markdown_code_fence_language_is_string() -> None:
     text, entities = render_markdown("```py\nprint('x')\n```")
 
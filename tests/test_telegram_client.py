@@ -36,6 +36,81 @@ async def test_telegram_429_no_retry() -> None:
     assert len(calls) == 1
 
 
+@pytest.mark.anyio
+async def test_telegram_retries_once_on_connect_error() -> None:
+    calls: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        if len(calls) == 1:
+            raise httpx.ConnectError("connection reset", request=request)
+        return httpx.Response(
+            200,
+            json={"ok": True, "result": {"message_id": 7}},
+            request=request,
+        )
+
+    transport = httpx.MockTransport(handler)
+
+    client = httpx.AsyncClient(transport=transport)
+    try:
+        tg = TelegramClient("123:abcDEF_ghij", client=client)
+        result = await tg._post("sendMessage", {"chat_id": 1, "text": "hi"})
+    finally:
+        await client.aclose()
+
+    assert result == {"message_id": 7}
+    assert len(calls) == 2
+
+
+@pytest.mark.anyio
+async def test_telegram_retries_once_on_remote_protocol_error() -> None:
+    calls: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        if len(calls) == 1:
+            raise httpx.RemoteProtocolError("server disconnected", request=request)
+        return httpx.Response(
+            200,
+            json={"ok": True, "result": {"message_id": 8}},
+            request=request,
+        )
+
+    transport = httpx.MockTransport(handler)
+
+    client = httpx.AsyncClient(transport=transport)
+    try:
+        tg = TelegramClient("123:abcDEF_ghij", client=client)
+        result = await tg._post("sendMessage", {"chat_id": 1, "text": "hi"})
+    finally:
+        await client.aclose()
+
+    assert result == {"message_id": 8}
+    assert len(calls) == 2
+
+
+@pytest.mark.anyio
+async def test_telegram_gives_up_after_one_retry() -> None:
+    calls: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        raise httpx.ConnectError("connection refused", request=request)
+
+    transport = httpx.MockTransport(handler)
+
+    client = httpx.AsyncClient(transport=transport)
+    try:
+        tg = TelegramClient("123:abcDEF_ghij", client=client)
+        result = await tg._post("sendMessage", {"chat_id": 1, "text": "hi"})
+    finally:
+        await client.aclose()
+
+    assert result is None
+    assert len(calls) == 2
+
+
 @pytest.mark.anyio
 async def test_no_token_in_logs_on_http_error(
     caplog: pytest.LogCaptureFixture,